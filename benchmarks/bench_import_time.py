@@ -0,0 +1,66 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Measures CLI startup: the offline subcommands must add only milliseconds over
+# a bare interpreter. Timing is noisy, so this is run by hand; the deterministic
+# "no heavy imports" guard lives in tests/test_cli_imports.py.
+# Usage: python benchmarks/bench_import_time.py [--runs 20] [--budget-ms 40]
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+SCENARIOS = {
+    "normalize": ["normalize", "€ 1.234,56", "--clean", "--currency"],
+    "check-drops": ["check-drops", "--db", "{db}"],
+}
+
+
+def _env():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    return env
+
+
+def time_command(argv, runs):
+    """Median wall-clock seconds of `runs` fresh interpreter launches."""
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(argv, env=_env(), cwd=REPO_ROOT, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CLI import-time benchmark")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=40,
+                        help="Allowed startup overhead over `python -c pass` (default: 40)")
+    args = parser.parse_args()
+
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, "prices.db")
+        # check-drops refuses to run without an existing history file
+        subprocess.run([sys.executable, "-c", f"import sqlite3; sqlite3.connect({db!r}).close()"], check=True)
+
+        baseline = time_command([sys.executable, "-c", "pass"], args.runs)
+        print(f"{'python -c pass':26} {baseline * 1000:8.1f} ms")
+
+        for name, cli_args in SCENARIOS.items():
+            cli_args = [a.format(db=db) for a in cli_args]
+            elapsed = time_command([sys.executable, "-m", "price_scraper", *cli_args], args.runs)
+            overhead_ms = (elapsed - baseline) * 1000
+            print(f"{'price-scraper ' + name:26} {elapsed * 1000:8.1f} ms  (+{overhead_ms:.1f} ms)")
+
+            if overhead_ms > args.budget_ms:
+                failures.append(f"{name}: +{overhead_ms:.1f} ms exceeds {args.budget_ms:.0f} ms budget")
+
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
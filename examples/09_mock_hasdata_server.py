@@ -0,0 +1,282 @@
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Local stand-in for https://api.hasdata.com/scrape/web
+# Serves canned 'html' and 'aiResponse' payloads so the scraping scripts can be
+# load-tested without spending API credits.
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+def parse_latency(spec):
+    """
+    Builds a latency sampler from a compact spec string.
+
+    Args:
+        spec: "fixed:0.2", "uniform:0.1,0.5", "normal:0.3,0.05",
+              "lognormal:-1.2,0.4" or "exp:0.25" (all in seconds)
+
+    Returns:
+        Callable taking a random.Random and returning a delay in seconds
+    """
+    kind, _, raw_args = spec.partition(":")
+    try:
+        args = [float(a) for a in raw_args.split(",")] if raw_args else []
+    except ValueError:
+        raise ValueError(f"Invalid latency spec: {spec}")
+
+    samplers = {
+        "fixed": (1, lambda rng, a: a[0]),
+        "uniform": (2, lambda rng, a: rng.uniform(a[0], a[1])),
+        "normal": (2, lambda rng, a: rng.gauss(a[0], a[1])),
+        "lognormal": (2, lambda rng, a: rng.lognormvariate(a[0], a[1])),
+        "exp": (1, lambda rng, a: rng.expovariate(1 / a[0])),
+    }
+    if kind not in samplers or len(args) != samplers[kind][0]:
+        raise ValueError(f"Invalid latency spec: {spec}")
+
+    # Catch bad parameters here; inside do_POST they would kill the handler
+    # thread and surface to the client as dropped connections
+    if kind == "fixed" and args[0] < 0:
+        raise ValueError(f"Latency must be non-negative: {spec}")
+    if kind == "uniform" and not 0 <= args[0] <= args[1]:
+        raise ValueError(f"Uniform bounds must satisfy 0 <= lo <= hi: {spec}")
+    if kind in ("normal", "lognormal") and args[1] <= 0:
+        raise ValueError(f"Sigma must be positive: {spec}")
+    if kind == "exp" and args[0] <= 0:
+        raise ValueError(f"Mean must be positive: {spec}")
+
+    sample = samplers[kind][1]
+    # Negative draws (e.g. from a wide normal) are clamped to "no delay"
+    return lambda rng: max(0.0, sample(rng, args))
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket used to emulate the account-level rate limit.
+    Refills at `rate` tokens per second up to `burst` tokens.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.capacity = burst or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Takes one token if available.
+        Returns 0 on success, otherwise the seconds until a token frees up.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+            return (1 - self.tokens) / self.rate
+
+
+class MockConfig:
+    """
+    Runtime knobs for the stand-in server.
+
+    Args:
+        latency: Spec string understood by parse_latency()
+        error_429: Probability of injecting a 429 on an otherwise valid request
+        error_5xx: Probability of injecting a 500/502/503
+        rate_limit: Requests per second before real 429s kick in (None = unlimited)
+        fixtures_dir: Directory holding product.html and ai_response.json
+        seed: Seed for reproducible latency/error draws
+    """
+
+    def __init__(self, latency="fixed:0", error_429=0.0, error_5xx=0.0,
+                 rate_limit=None, fixtures_dir=FIXTURES_DIR, seed=None):
+        for name, rate in (("error_429", error_429), ("error_5xx", error_5xx)):
+            if not 0 <= rate <= 1:
+                raise ValueError(f"{name} must be a probability in [0, 1], got {rate}")
+        if error_429 + error_5xx > 1:
+            raise ValueError(f"error_429 + error_5xx must not exceed 1, got {error_429 + error_5xx}")
+        # A non-positive rate builds a bucket that never refills (100% 429s)
+        if rate_limit is not None and rate_limit <= 0:
+            raise ValueError(f"rate_limit must be positive, got {rate_limit}")
+
+        self.sample_latency = parse_latency(latency)
+        self.error_429 = error_429
+        self.error_5xx = error_5xx
+        self.bucket = TokenBucket(rate_limit) if rate_limit is not None else None
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+
+        fixtures_dir = Path(fixtures_dir)
+        self.html = (fixtures_dir / "product.html").read_text(encoding="utf-8")
+        self.ai_responses = json.loads((fixtures_dir / "ai_response.json").read_text(encoding="utf-8"))
+
+    def draw(self):
+        """Returns (delay_seconds, injected_status_or_None) for one request."""
+        with self.rng_lock:
+            delay = self.sample_latency(self.rng)
+            roll = self.rng.random()
+            if roll < self.error_429:
+                return delay, 429
+            if roll < self.error_429 + self.error_5xx:
+                return delay, self.rng.choice([500, 502, 503])
+            return delay, None
+
+    def ai_response(self, rules, country):
+        """
+        Answers each key of 'aiExtractRules' from the fixtures.
+        Country-specific entries win over the "default" block.
+        """
+        default = self.ai_responses.get("default", {})
+        regional = self.ai_responses.get((country or "").upper(), {})
+        return {key: regional.get(key, default.get(key)) for key in rules}
+
+
+class MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The stdlib default backlog (5) drops connections under load,
+    # which shows up as ~1s SYN-retry spikes in the client's p99
+    request_queue_size = 256
+
+
+def make_handler(config):
+    """Binds a request handler class to the given MockConfig."""
+
+    class HasDataHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        quiet = True
+
+        def log_message(self, format, *args):
+            if not self.quiet:
+                super().log_message(format, *args)
+
+        def _send(self, status, body, content_type="application/json", headers=None):
+            if not isinstance(body, (bytes, str)):
+                body = json.dumps(body)
+            if isinstance(body, str):
+                body = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            raw_body = self.rfile.read(length)
+
+            if self.path.split("?")[0] != "/scrape/web":
+                return self._send(404, {"message": f"Unknown endpoint: {self.path}"})
+
+            if not self.headers.get("x-api-key"):
+                return self._send(401, {"message": "Missing x-api-key header"})
+
+            try:
+                payload = json.loads(raw_body or b"{}")
+            except json.JSONDecodeError:
+                return self._send(400, {"message": "Body must be valid JSON"})
+            if not payload.get("url"):
+                return self._send(400, {"message": "'url' is required"})
+
+            # Rate limit rejections are immediate, like the real gateway
+            if config.bucket:
+                retry_after = config.bucket.acquire()
+                if retry_after:
+                    return self._send(
+                        429,
+                        {"message": "Too many requests"},
+                        headers={"Retry-After": str(max(1, round(retry_after)))},
+                    )
+
+            delay, injected_status = config.draw()
+            time.sleep(delay)
+
+            if injected_status:
+                return self._send(injected_status, {"message": f"Injected error {injected_status}"})
+
+            output_format = payload.get("outputFormat") or ["html", "json"]
+            # HTML-only output comes back as the raw page, everything else as JSON
+            if output_format == ["html"]:
+                return self._send(200, config.html, content_type="text/html; charset=utf-8")
+
+            result = {
+                "requestMetadata": {"url": payload["url"], "status": "ok"},
+                "html": config.html,
+            }
+            if payload.get("aiExtractRules"):
+                result["aiResponse"] = config.ai_response(
+                    payload["aiExtractRules"], payload.get("proxyCountry")
+                )
+            return self._send(200, result)
+
+    return HasDataHandler
+
+
+def serve(config, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """
+    Starts the stand-in in a background thread.
+    Pass port=0 to bind a free port; read it back from server.server_address.
+    """
+    server = MockServer((host, port), make_handler(config))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def add_mock_arguments(parser):
+    """Registers the mock's tuning flags (shared with 10_load_test.py)."""
+    parser.add_argument("--latency", default="fixed:0",
+                        help="fixed:S | uniform:LO,HI | normal:MU,SIGMA | lognormal:MU,SIGMA | exp:MEAN")
+    parser.add_argument("--error-429", type=float, default=0.0, help="Injected 429 probability")
+    parser.add_argument("--error-5xx", type=float, default=0.0, help="Injected 5xx probability")
+    parser.add_argument("--rate-limit", type=float, default=None, help="Requests per second (default: unlimited)")
+    parser.add_argument("--fixtures", default=str(FIXTURES_DIR), help="Fixtures directory")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for latency/error draws")
+
+
+def config_from_args(args):
+    return MockConfig(
+        latency=args.latency,
+        error_429=args.error_429,
+        error_5xx=args.error_5xx,
+        rate_limit=args.rate_limit,
+        fixtures_dir=args.fixtures,
+        seed=args.seed,
+    )
+
+
+# Usage: python 09_mock_hasdata_server.py --latency lognormal:-1.2,0.4 --error-429 0.05
+#        HASDATA_API_URL=http://127.0.0.1:8765/scrape/web python 04_selector_hierarchy.py
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local HasData stand-in")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    add_mock_arguments(parser)
+    args = parser.parse_args()
+
+    try:
+        config = config_from_args(args)
+    except ValueError as e:
+        parser.error(str(e))
+
+    handler = make_handler(config)
+    handler.quiet = not args.verbose
+    server = MockServer((args.host, args.port), handler)
+
+    print(f"Mock HasData listening on http://{args.host}:{args.port}/scrape/web")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -0,0 +1,179 @@
+import argparse
+import importlib.util
+import itertools
+import math
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from price_scraper import (
+    fetch_price_variants,
+    get_price_from_region,
+    normalize_price,
+    scrape_price_with_fallbacks,
+)
+
+# End-to-end load harness: drives the real scraping flows against the local
+# HasData stand-in (09_mock_hasdata_server.py) at a fixed concurrency.
+EXAMPLES_DIR = Path(__file__).parent
+
+# The stand-in only checks that a key is present and ignores the target URL
+API_KEY = "LOAD_TEST_KEY"
+TARGET_URL = "https://demo.evershop.io/accessories/modern-ceramic-vase-green"
+TARGET_REGIONS = ["US", "DE", "IN", "BR"]
+
+
+def load_example(filename):
+    """Imports a numbered example script (not importable by name) from its path."""
+    path = EXAMPLES_DIR / filename
+    module_name = "example_" + path.stem.split("_", 1)[1]
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_flows(api_url):
+    """
+    Returns {flow_name: callable}. Each call performs exactly one API request,
+    so latencies are comparable across flows. Failures must raise.
+    """
+    # The geo audit fans out one request per region; rotate through them
+    regions = itertools.cycle(TARGET_REGIONS)
+    regions_lock = threading.Lock()
+
+    def geo_flow():
+        with regions_lock:
+            region = next(regions)
+        raw_price = get_price_from_region(TARGET_URL, region, API_KEY, api_url=api_url)
+        # normalize_price(None) returns None; a missing price is a failure, not a fast success
+        if raw_price is None:
+            raise ValueError(f"{region}: no price in aiResponse")
+        return normalize_price(raw_price)
+
+    return {
+        "selector": lambda: scrape_price_with_fallbacks(TARGET_URL, API_KEY, api_url=api_url),
+        "ai": lambda: fetch_price_variants(TARGET_URL, API_KEY, api_url=api_url),
+        "geo": geo_flow,
+    }
+
+
+def classify_error(exc):
+    """Buckets failures by the HTTP status they carry, else by exception type."""
+    status = getattr(exc, "status_code", None)
+    return str(status) if status is not None else type(exc).__name__
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile over an already sorted list."""
+    if not sorted_values:
+        return None
+    # ceil, not round: round() goes to even on .5 and under-reports the rank
+    rank = min(max(1, math.ceil(pct / 100 * len(sorted_values))), len(sorted_values))
+    return sorted_values[rank - 1]
+
+
+def run_flow(flow, total_requests, concurrency):
+    """
+    Fires `total_requests` calls of `flow` from `concurrency` worker threads.
+
+    Returns:
+        dict with throughput (req/s), p50/p99 latency of successful calls (s),
+        error_rate and a Counter of error classes
+    """
+    latencies = []
+    errors = Counter()
+    lock = threading.Lock()
+
+    def one_call(_):
+        started = time.perf_counter()
+        try:
+            flow()
+        except Exception as e:
+            with lock:
+                errors[classify_error(e)] += 1
+            return
+        elapsed = time.perf_counter() - started
+        with lock:
+            latencies.append(elapsed)
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one_call, range(total_requests)))
+    wall = time.perf_counter() - wall_start
+
+    latencies.sort()
+    return {
+        "requests": total_requests,
+        "throughput": total_requests / wall if wall else 0.0,
+        "p50": percentile(latencies, 50),
+        "p99": percentile(latencies, 99),
+        "error_rate": sum(errors.values()) / total_requests if total_requests else 0.0,
+        "errors": errors,
+    }
+
+
+def format_ms(seconds):
+    return "-" if seconds is None else f"{seconds * 1000:.1f}"
+
+
+def print_report(results, concurrency):
+    header = f"{'Flow':9} | {'Reqs':>6} | {'Req/s':>8} | {'p50 ms':>8} | {'p99 ms':>8} | {'Errors':>7} | Breakdown"
+    print(f"Concurrency: {concurrency}")
+    print(header)
+    print("-" * len(header))
+    for name, r in results.items():
+        breakdown = ", ".join(f"{k}={v}" for k, v in sorted(r["errors"].items())) or "-"
+        print(
+            f"{name:9} | {r['requests']:>6} | {r['throughput']:>8.1f} | "
+            f"{format_ms(r['p50']):>8} | {format_ms(r['p99']):>8} | "
+            f"{r['error_rate']:>6.1%} | {breakdown}"
+        )
+
+
+# Usage: python 10_load_test.py --concurrency 32 --requests 500 --latency lognormal:-1.5,0.5 --error-429 0.05
+#        python 10_load_test.py --target http://127.0.0.1:8765/scrape/web   (mock started separately)
+if __name__ == "__main__":
+    mock = load_example("09_mock_hasdata_server.py")
+
+    parser = argparse.ArgumentParser(description="Load-test scraping flows against the HasData stand-in")
+    parser.add_argument("--target", default=None,
+                        help="Endpoint to hit; omit to start an in-process mock on a free port")
+    parser.add_argument("--flows", default="selector,ai,geo", help="Comma-separated: selector, ai, geo")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=200, help="Requests per flow")
+    mock.add_mock_arguments(parser)
+    args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.requests < 1:
+        parser.error("--requests must be at least 1")
+
+    server = None
+    target = args.target
+    if not target:
+        try:
+            config = mock.config_from_args(args)
+        except ValueError as e:
+            parser.error(str(e))
+        server = mock.serve(config, port=0)
+        host, port = server.server_address[:2]
+        target = f"http://{host}:{port}/scrape/web"
+    print(f"Target: {target}")
+
+    flows = build_flows(target)
+    selected = [name.strip() for name in args.flows.split(",") if name.strip()]
+    unknown = set(selected) - set(flows)
+    if unknown:
+        parser.error(f"Unknown flows: {', '.join(sorted(unknown))}")
+
+    results = {}
+    for name in selected:
+        results[name] = run_flow(flows[name], args.requests, args.concurrency)
+
+    print_report(results, args.concurrency)
+
+    if server:
+        server.shutdown()
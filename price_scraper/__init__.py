@@ -0,0 +1,38 @@
+"""
+Price Scraping Toolkit.
+
+Public names are resolved lazily (PEP 562) so that `import price_scraper`
+stays cheap: requests, bs4, playwright and sqlite3 are only imported by the
+submodules that need them, and only when those submodules are first used.
+"""
+import importlib
+
+_EXPORTS = {
+    "normalize_price": "normalization",
+    "extract_clean_price": "cleanup",
+    "extract_currency": "currency",
+    "CURRENCY_MAP": "currency",
+    "extract_price_from_html": "extraction",
+    "scrape_price_with_fallbacks": "extraction",
+    "fetch_price_variants": "extraction",
+    "get_price_from_region": "extraction",
+    "capture_products": "interception",
+    "PriceTracker": "monitoring",
+    "HasDataError": "hasdata",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,105 @@
+"""
+Command-line entry point: `price-scraper` / `python -m price_scraper`.
+
+Only stdlib-backed helpers are reachable from here, and each subcommand
+imports what it needs inside its handler, so startup stays in the
+milliseconds (guarded by tests/test_cli_imports.py).
+"""
+import argparse
+import os
+import sys
+
+
+def _normalize(args):
+    from .normalization import normalize_price
+
+    if args.clean:
+        from .cleanup import extract_clean_price
+    if args.currency:
+        from .currency import extract_currency
+
+    # Read one value per line from stdin when none are given, for piping
+    values = args.values or [line.strip() for line in sys.stdin if line.strip()]
+
+    failures = 0
+    for raw in values:
+        try:
+            if args.clean:
+                price = extract_clean_price(raw, args.locale)
+            else:
+                price = normalize_price(raw, args.locale)
+            # Both helpers return None for empty input rather than raising
+            if price is None:
+                raise ValueError("empty value")
+        except ValueError as e:
+            print(f"{raw}\terror: {e}", file=sys.stderr)
+            failures += 1
+            continue
+
+        columns = [raw, str(price)]
+        if args.currency:
+            columns.append(extract_currency(raw, proxy_country=args.country))
+        print("\t".join(columns))
+
+    return 1 if failures else 0
+
+
+def _check_drops(args):
+    # Don't let a typo silently create an empty database
+    if not os.path.exists(args.db):
+        print(f"No such database: {args.db}", file=sys.stderr)
+        return 2
+
+    import sqlite3
+
+    from .monitoring import PriceTracker
+
+    try:
+        tracker = PriceTracker(args.db)
+        urls = args.urls or tracker.urls()
+        alerts = [(url, tracker.check_drop(url, threshold_percent=args.threshold)) for url in urls]
+    except sqlite3.DatabaseError as e:
+        print(f"Cannot read database {args.db}: {e}", file=sys.stderr)
+        return 2
+
+    for url, alert in alerts:
+        if alert:
+            print(
+                f"{url}\t{alert['previous']} -> {alert['current']}\t"
+                f"-{alert['savings']} ({alert['discount']:.1f}% off)"
+            )
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="price-scraper", description="Price Scraping Toolkit")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    normalize = subcommands.add_parser("normalize", help="Convert price strings to Decimal")
+    normalize.add_argument("values", nargs="*", help="Raw price strings (default: read lines from stdin)")
+    normalize.add_argument("--locale", choices=["AUTO", "US", "EU"], default="AUTO",
+                           help="Separator convention (default: AUTO)")
+    normalize.add_argument("--clean", action="store_true",
+                           help="Strip marketing copy ('Was $X', 'Save Y') before parsing")
+    normalize.add_argument("--currency", action="store_true", help="Append the resolved ISO 4217 code")
+    normalize.add_argument("--country", default=None,
+                           help="Proxy country used to disambiguate '$' and 'kr' (with --currency)")
+    normalize.set_defaults(handler=_normalize)
+
+    check_drops = subcommands.add_parser("check-drops", help="Report price drops from tracked history")
+    check_drops.add_argument("urls", nargs="*", help="URLs to check (default: every tracked URL)")
+    check_drops.add_argument("--db", default="prices.db", help="SQLite history file (default: prices.db)")
+    check_drops.add_argument("--threshold", type=float, default=10,
+                             help="Minimum drop in percent (default: 10)")
+    check_drops.set_defaults(handler=_check_drops)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
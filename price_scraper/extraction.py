@@ -0,0 +1,205 @@
+import json
+import re
+from decimal import Decimal
+
+from . import hasdata
+from .normalization import normalize_price
+
+# Schema for HasData's LLM extraction of multi-variant pricing
+PRICE_VARIANT_RULES = {
+    "price_data": {
+        "type": "list",
+        "output": {
+            "product_variant": {
+                "type": "string",
+                "description": "Current product or product variant"
+            },
+            "current_price": {
+                "type": "string",
+                "description": "Current selling price with currency symbol"
+            },
+            "original_price": {
+                "type": "string",
+                "description": "Original price before discount if available"
+            },
+            "currency": {
+                "type": "string",
+                "description": "ISO 4217 currency code (USD, EUR, GBP)"
+            },
+            "availability": {
+                "type": "string",
+                "description": "Stock status: In Stock, Out of Stock, or specific quantity"
+            }
+        }
+    }
+}
+
+
+def extract_price_from_html(html):
+    """
+    Implements the 'Hierarchy of Reliability':
+    1. Structured Data (JSON-LD). Most stable, machine-readable.
+    2. Semantic HTML (Meta Tags). Very stable, used for SEO.
+    3. Data Attributes. Stable, used for internal JS logic.
+    4. CSS Classes. Fragile, prone to design changes.
+
+    Returns:
+        (Decimal price, ISO currency, source label)
+    """
+    # bs4 is slow to import; only pay for it when actually parsing
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Priority 1: JSON-LD Structured Data
+    # E-commerce sites use this for Google Shopping. It rarely changes.
+    json_ld = soup.find("script", {"type": "application/ld+json"})
+    if json_ld:
+        try:
+            data = json.loads(json_ld.string)
+            # JSON-LD structures vary; look for 'offers' key
+            if "offers" in data:
+                offer = data["offers"]
+                # Handle list of offers (variants) vs single offer
+                if isinstance(offer, list):
+                    offer = offer[0]
+
+                price_str = str(offer.get("price", ""))
+                currency = offer.get("priceCurrency", "USD")
+
+                if price_str:
+                    return Decimal(price_str), currency, "JSON-LD (Priority 1)"
+        except json.JSONDecodeError:
+            pass
+
+    # Priority 2: Semantic HTML (Schema.org microdata)
+    # SEO tags like <meta itemprop="price" content="1200.00">
+    price_meta = soup.find("meta", {"itemprop": "price"})
+    if price_meta and price_meta.get("content"):
+        currency_meta = soup.find("meta", {"itemprop": "priceCurrency"})
+        currency = currency_meta.get("content", "USD") if currency_meta else "USD"
+        return Decimal(price_meta["content"]), currency, "Meta Tags (Priority 2)"
+
+    # Priority 3: Common data-* attributes
+    # Developers often put raw numbers in data attributes for JS calculations
+    for attr in ["data-price", "data-product-price", "data-price-amount"]:
+        elem = soup.find(attrs={attr: True})
+        if elem:
+            price_str = elem.get(attr)
+            clean = re.sub(r'[^\d.]', '', price_str)
+            if clean:
+                return Decimal(clean), "USD", f"Attribute [{attr}] (Priority 3)"
+
+    # Priority 4: Class-based selectors (Fragile fallback)
+    # Only use this if all above fail.
+    price_selectors = [
+        ".product-price", ".price-value-2", ".projected-price", ".money", ".price", ".product__single__price"
+    ]
+    for selector in price_selectors:
+        elem = soup.select_one(selector)
+        if elem:
+            text = elem.get_text(strip=True)
+            # Remove currency symbols and non-numeric chars
+            clean = re.sub(r'[^\d.]', '', text)
+            if clean:
+                return Decimal(clean), "USD", f"CSS Selector [{selector}] (Priority 4)"
+
+    raise ValueError("No price found in document")
+
+
+def scrape_price_with_fallbacks(url, api_key, proxy_country="US", api_url=None):
+    """
+    Fetches rendered HTML through HasData and runs the selector hierarchy on it.
+
+    Returns:
+        (Decimal price, ISO currency, source label)
+    """
+    payload = {
+        "url": url,
+        "proxyType": "residential",
+        "proxyCountry": proxy_country,  # Pins the currency the site serves
+        "jsRendering": True,            # Essential for modern React/Vue sites
+        "outputFormat": ["html"]        # We want the raw HTML to parse locally
+    }
+
+    response = hasdata.scrape(payload, api_key, api_url=api_url)
+
+    if response.status_code != 200:
+        raise hasdata.HasDataError(response.status_code)
+
+    try:
+        return extract_price_from_html(response.content)
+    except ValueError:
+        raise ValueError(f"No price found on {url}")
+
+
+def _price_or_none(price_str):
+    """LLM output is free text; treat anything unparseable as missing."""
+    try:
+        price = normalize_price(price_str)
+    except ValueError:
+        return None
+    return str(price) if price is not None else None
+
+
+def fetch_price_variants(url, api_key, proxy_country="US", api_url=None):
+    """
+    Runs HasData AI extraction and flattens 'aiResponse.price_data'
+    into one row per variant with normalized prices.
+    """
+    payload = {
+        "url": url,
+        "proxyType": "residential",
+        "proxyCountry": proxy_country,
+        "jsRendering": True,
+        "aiExtractRules": PRICE_VARIANT_RULES
+    }
+
+    response = hasdata.scrape(payload, api_key, api_url=api_url)
+
+    if response.status_code != 200:
+        raise hasdata.HasDataError(response.status_code)
+
+    data = response.json()
+    price_info = data.get("aiResponse", {}).get("price_data", [])
+
+    rows = []
+
+    for item in price_info:
+        row = {
+            "variant": item.get("product_variant"),
+            "current_price": _price_or_none(item.get("current_price")),
+            "original_price": _price_or_none(item.get("original_price")),
+            "currency": item.get("currency"),
+            "availability": item.get("availability"),
+        }
+        rows.append(row)
+
+    return rows
+
+
+def get_price_from_region(url, country_code, api_key, api_url=None):
+    """
+    Fetches the raw price string as seen by a user in a specific country.
+    """
+    payload = {
+        "url": url,
+        "proxyType": "residential",
+        # This parameter routes traffic through a physical ISP in the target nation
+        "proxyCountry": country_code,
+        "jsRendering": True,
+        # Using AI extraction to handle different layouts/languages per region automatically
+        "aiExtractRules": {
+            "price": {
+                "type": "string",
+                "description": "The price of current product variant"
+            }
+        }
+    }
+
+    response = hasdata.scrape(payload, api_key, timeout=45, api_url=api_url)
+
+    if response.status_code != 200:
+        raise hasdata.HasDataError(response.status_code)
+
+    return response.json().get("aiResponse", {}).get("price")
@@ -0,0 +1,47 @@
+import os
+
+DEFAULT_API_URL = "https://api.hasdata.com/scrape/web"
+
+
+def resolve_api_url(api_url=None):
+    """
+    Picks the endpoint for one request: an explicit `api_url` wins, then the
+    HASDATA_API_URL environment variable, then the production endpoint.
+    Point either at a local stand-in (see examples/09_mock_hasdata_server.py)
+    to test without spending credits.
+    """
+    # Read on every call so changing the variable at runtime takes effect;
+    # an empty variable counts as unset
+    return api_url or os.environ.get("HASDATA_API_URL") or DEFAULT_API_URL
+
+
+class HasDataError(ConnectionError):
+    """Non-200 response from HasData; `status_code` carries the HTTP status."""
+
+    def __init__(self, status_code):
+        super().__init__(f"API Error: {status_code}")
+        self.status_code = status_code
+
+
+def scrape(payload, api_key, timeout=30, api_url=None):
+    """
+    POSTs a scrape job to the HasData web endpoint.
+
+    Args:
+        payload: Request body (url, proxyType, outputFormat, aiExtractRules...)
+        api_key: HasData API key
+        timeout: Seconds before the request is abandoned
+        api_url: Endpoint override (default: see resolve_api_url())
+
+    Returns:
+        requests.Response
+    """
+    # Imported here so the offline helpers (and the CLI) never pay for it
+    import requests
+
+    return requests.post(
+        resolve_api_url(api_url),
+        headers={"x-api-key": api_key, "Content-Type": "application/json"},
+        json=payload,
+        timeout=timeout
+    )
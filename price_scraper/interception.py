@@ -0,0 +1,60 @@
+def capture_products(target_url, api_part, settle_ms=8000):
+    """
+    Loads a SPA in headless Chromium and collects products from the internal
+    API responses it makes, instead of parsing the rendered DOM.
+
+    Args:
+        target_url: Listing page to open
+        api_part: Substring identifying the product API calls
+        settle_ms: Extra wait after 'networkidle' for lazy-loaded batches
+
+    Returns:
+        list of product dicts (deduplicated by cloudProductId)
+    """
+    # Playwright is optional and heavy; only required for this module
+    from playwright.sync_api import sync_playwright
+
+    products = []
+    seen_ids = set()
+
+    def handle_response(response):
+        if api_part not in response.url:
+            return
+        try:
+            data = response.json()
+        except Exception:
+            return
+
+        for p in data.get("hydratedProducts", []):
+            pid = p.get("cloudProductId")
+            if pid in seen_ids:
+                continue
+            seen_ids.add(pid)
+
+            current = p.get("currentPrice")
+            full = p.get("fullPrice")
+
+            discount = None
+            if current and full and full > current:
+                discount = round((1 - current / full) * 100, 1)
+
+            products.append({
+                "name": p.get("name"),
+                "brand": p.get("brand"),
+                "category": p.get("category"),
+                "color": p.get("color"),
+                "current_price": current,
+                "full_price": full,
+                "on_sale": p.get("isOnSale"),
+                "discount": discount,
+            })
+
+    with sync_playwright() as pw:
+        browser = pw.chromium.launch(headless=True)
+        page = browser.new_page()
+        page.on("response", handle_response)
+        page.goto(target_url, wait_until="networkidle")
+        page.wait_for_timeout(settle_ms)
+        browser.close()
+
+    return products
@@ -0,0 +1,89 @@
+from decimal import Decimal
+
+import pytest
+
+from price_scraper.cli import main
+from price_scraper.monitoring import PriceTracker
+
+URL = "https://demo.nopcommerce.com/camera-photo"
+
+
+@pytest.fixture
+def seeded_db(tmp_path):
+    db = tmp_path / "prices.db"
+    tracker = PriceTracker(str(db))
+    tracker.save(URL, Decimal("249.99"))
+    tracker.save(URL, Decimal("199.99"))
+    tracker.conn.close()
+    return db
+
+
+def test_normalize_prints_raw_and_value(capsys):
+    assert main(["normalize", "€ 1.234,56", "$1,234.56"]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "€ 1.234,56\t1234.56",
+        "$1,234.56\t1234.56",
+    ]
+
+
+def test_normalize_currency_column_uses_country(capsys):
+    assert main(["normalize", "$49.99", "--currency", "--country", "CA"]) == 0
+    assert capsys.readouterr().out.splitlines() == ["$49.99\t49.99\tCAD"]
+
+
+def test_normalize_clean_strips_marketing_copy(capsys):
+    assert main(["normalize", "--clean", "Was $129.99 Now $99.99"]) == 0
+    assert capsys.readouterr().out.splitlines() == ["Was $129.99 Now $99.99\t99.99"]
+
+
+@pytest.mark.parametrize("locale, raw, expected", [
+    ("EU", "1.234,56", "1234.56"),
+    ("EU", "Was €2.000,00 Now €1.234,56", "1234.56"),
+    ("US", "Now $1,234.56", "1234.56"),
+    ("AUTO", "1,20 €", "1.20"),
+])
+def test_normalize_clean_honours_locale(capsys, locale, raw, expected):
+    assert main(["normalize", "--clean", "--locale", locale, raw]) == 0
+    assert capsys.readouterr().out.splitlines() == [f"{raw}\t{expected}"]
+
+
+def test_normalize_exits_1_when_any_value_fails(capsys):
+    assert main(["normalize", "$5.00", "abc"]) == 1
+    captured = capsys.readouterr()
+    # Good values are still printed; failures go to stderr
+    assert captured.out.splitlines() == ["$5.00\t5.00"]
+    assert "abc\terror:" in captured.err
+
+
+def test_normalize_reports_empty_value_as_error(capsys):
+    assert main(["normalize", ""]) == 1
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "error: empty value" in captured.err
+
+
+def test_check_drops_missing_db_returns_2(tmp_path, capsys):
+    missing = tmp_path / "missing.db"
+    assert main(["check-drops", "--db", str(missing)]) == 2
+    assert "No such database" in capsys.readouterr().err
+    # Must not create the file as a side effect
+    assert not missing.exists()
+
+
+def test_check_drops_reports_drop(seeded_db, capsys):
+    assert main(["check-drops", "--db", str(seeded_db)]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        f"{URL}\t249.99 -> 199.99\t-50.00 (20.0% off)"
+    ]
+
+
+def test_check_drops_respects_threshold(seeded_db, capsys):
+    assert main(["check-drops", "--db", str(seeded_db), "--threshold", "25"]) == 0
+    assert capsys.readouterr().out == ""
+
+
+def test_check_drops_non_sqlite_file_returns_2(tmp_path, capsys):
+    bogus = tmp_path / "prices.db"
+    bogus.write_text("definitely not sqlite " * 100)
+    assert main(["check-drops", "--db", str(bogus)]) == 2
+    assert "Cannot read database" in capsys.readouterr().err
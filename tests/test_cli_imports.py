@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# The offline subcommands must start in milliseconds, so they may not pull in
+# the network, parsing or browser stacks. Each case runs in a fresh interpreter
+# because sys.modules in the test process is already polluted.
+REPO_ROOT = Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ("requests", "bs4", "playwright")
+
+
+def leaked_modules(code, forbidden):
+    """Runs `code` in a child interpreter and lists forbidden modules it imported."""
+    probe = (
+        "import sys, contextlib, io\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        f"    exec({code!r})\n"
+        f"print(','.join(m for m in {forbidden!r} if m in sys.modules))\n"
+    )
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    result = subprocess.run([sys.executable, "-c", probe], env=env, cwd=REPO_ROOT,
+                            check=True, capture_output=True, text=True)
+    return [m for m in result.stdout.strip().split(",") if m]
+
+
+def run_cli(cli_args):
+    return f"from price_scraper.cli import main\nmain({cli_args!r})"
+
+
+@pytest.mark.parametrize("module", ["price_scraper", "price_scraper.cli"])
+def test_import_is_lazy(module):
+    assert leaked_modules(f"import {module}", HEAVY_MODULES + ("sqlite3",)) == []
+
+
+def test_normalize_imports_no_heavy_modules():
+    cli_args = ["normalize", "€ 1.234,56", "--clean", "--currency"]
+    assert leaked_modules(run_cli(cli_args), HEAVY_MODULES + ("sqlite3",)) == []
+
+
+def test_check_drops_imports_no_heavy_modules(tmp_path):
+    db = tmp_path / "prices.db"
+    # check-drops refuses to run without an existing history file
+    db.touch()
+    assert leaked_modules(run_cli(["check-drops", "--db", str(db)]), HEAVY_MODULES) == []
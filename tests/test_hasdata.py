@@ -0,0 +1,33 @@
+import pytest
+
+from price_scraper.hasdata import DEFAULT_API_URL, HasDataError, resolve_api_url
+
+MOCK_URL = "http://127.0.0.1:8765/scrape/web"
+
+
+def test_resolve_api_url_defaults_to_production(monkeypatch):
+    monkeypatch.delenv("HASDATA_API_URL", raising=False)
+    assert resolve_api_url() == DEFAULT_API_URL
+
+
+def test_resolve_api_url_reads_env_on_each_call(monkeypatch):
+    monkeypatch.setenv("HASDATA_API_URL", MOCK_URL)
+    assert resolve_api_url() == MOCK_URL
+    monkeypatch.setenv("HASDATA_API_URL", "http://other/scrape/web")
+    assert resolve_api_url() == "http://other/scrape/web"
+
+
+def test_resolve_api_url_treats_empty_env_as_unset(monkeypatch):
+    monkeypatch.setenv("HASDATA_API_URL", "")
+    assert resolve_api_url() == DEFAULT_API_URL
+
+
+def test_resolve_api_url_explicit_override_wins(monkeypatch):
+    monkeypatch.setenv("HASDATA_API_URL", "http://other/scrape/web")
+    assert resolve_api_url(MOCK_URL) == MOCK_URL
+
+
+def test_hasdata_error_carries_status():
+    with pytest.raises(ConnectionError) as excinfo:
+        raise HasDataError(429)
+    assert excinfo.value.status_code == 429
@@ -0,0 +1,141 @@
+import importlib.util
+import json
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples"
+
+
+def load_example(filename):
+    """Imports a numbered example script the same way 10_load_test.py does."""
+    path = EXAMPLES_DIR / filename
+    module_name = "example_" + path.stem.split("_", 1)[1]
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+mock = load_example("09_mock_hasdata_server.py")
+load_test = load_example("10_load_test.py")
+
+
+@pytest.mark.parametrize("n, pct, rank", [
+    (101, 50, 51),
+    (150, 99, 149),
+    (100, 50, 50),
+    (100, 99, 99),
+    (1, 99, 1),
+    (10, 0, 1),
+])
+def test_percentile_is_nearest_rank(n, pct, rank):
+    assert load_test.percentile(list(range(1, n + 1)), pct) == rank
+
+
+def test_percentile_of_nothing_is_none():
+    assert load_test.percentile([], 50) is None
+
+
+def test_classify_error_uses_carried_status_only():
+    from price_scraper import HasDataError
+
+    assert load_test.classify_error(HasDataError(503)) == "503"
+    # Numbers in the message (ports, prices) must not look like statuses
+    assert load_test.classify_error(ConnectionError("127.0.0.1:404 refused")) == "ConnectionError"
+
+
+@pytest.mark.parametrize("spec", [
+    "exp:0",
+    "uniform:0.5,0.1",
+    "normal:0.3,0",
+    "lognormal:0,-1",
+    "fixed:-1",
+    "bogus:1",
+    "exp:a",
+    "uniform:0.1",
+])
+def test_parse_latency_rejects_bad_specs(spec):
+    with pytest.raises(ValueError):
+        mock.parse_latency(spec)
+
+
+def test_parse_latency_clamps_negative_draws():
+    import random
+
+    sample = mock.parse_latency("normal:-5,0.1")
+    assert sample(random.Random(0)) == 0.0
+
+
+@pytest.mark.parametrize("error_429, error_5xx", [
+    (1.5, 0),
+    (-0.1, 0),
+    (0, 2),
+    (0.6, 0.5),
+])
+def test_mock_config_rejects_bad_error_rates(error_429, error_5xx):
+    with pytest.raises(ValueError):
+        mock.MockConfig(error_429=error_429, error_5xx=error_5xx)
+
+
+@pytest.mark.parametrize("rate_limit", [0, -5])
+def test_mock_config_rejects_non_positive_rate_limit(rate_limit):
+    with pytest.raises(ValueError):
+        mock.MockConfig(rate_limit=rate_limit)
+
+
+def test_mock_config_rate_limit_none_is_unlimited():
+    assert mock.MockConfig(rate_limit=None).bucket is None
+
+
+def test_token_bucket_waits_once_empty():
+    bucket = mock.TokenBucket(rate=1, burst=2)
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() > 0
+
+
+@pytest.fixture
+def server():
+    srv = mock.serve(mock.MockConfig(), port=0)
+    yield f"http://127.0.0.1:{srv.server_address[1]}/scrape/web"
+    srv.shutdown()
+    srv.server_close()
+
+
+def post(url, payload, api_key="k"):
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"x-api-key": api_key, "Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return response.status, response.headers["Content-Type"], response.read()
+
+
+def test_html_output_format_returns_raw_page(server):
+    status, content_type, body = post(server, {"url": "https://x", "outputFormat": ["html"]})
+    assert status == 200
+    assert content_type.startswith("text/html")
+    assert b'"application/ld+json"' in body
+
+
+def test_ai_extract_rules_answered_per_country(server):
+    payload = {"url": "https://x", "proxyCountry": "de", "aiExtractRules": {"price": {}, "price_data": {}}}
+    status, content_type, body = post(server, payload)
+    data = json.loads(body)
+    assert status == 200
+    assert content_type == "application/json"
+    assert "<html" in data["html"]
+    # DE overrides 'price'; 'price_data' falls back to the default block
+    assert data["aiResponse"]["price"] == "EUR 17,56"
+    assert len(data["aiResponse"]["price_data"]) == 2
+
+
+def test_missing_api_key_is_401(server):
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        post(server, {"url": "https://x"}, api_key="")
+    assert excinfo.value.code == 401
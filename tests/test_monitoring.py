@@ -0,0 +1,32 @@
+from decimal import Decimal
+
+from price_scraper.monitoring import PriceTracker
+
+
+def test_check_drop_breaks_same_second_ties_by_insertion_order():
+    tracker = PriceTracker(":memory:")
+    # CURRENT_TIMESTAMP has one-second resolution; pin both rows to the same
+    # second so only the id tie-break decides which snapshot is latest
+    tracker.save("u", Decimal("249.99"))
+    tracker.save("u", Decimal("199.99"))
+    tracker.conn.execute("UPDATE price_history SET scraped_at = '2026-01-01 00:00:00'")
+
+    alert = tracker.check_drop("u", threshold_percent=10)
+
+    assert alert is not None
+    assert alert["previous"] == Decimal("249.99")
+    assert alert["current"] == Decimal("199.99")
+
+
+def test_check_drop_needs_two_snapshots():
+    tracker = PriceTracker(":memory:")
+    tracker.save("u", Decimal("10"))
+    assert tracker.check_drop("u") is None
+
+
+def test_urls_lists_tracked_urls():
+    tracker = PriceTracker(":memory:")
+    tracker.save("b", Decimal("1"))
+    tracker.save("a", Decimal("1"))
+    tracker.save("b", Decimal("2"))
+    assert tracker.urls() == ["a", "b"]